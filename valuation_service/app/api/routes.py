@@ -1,10 +1,18 @@
 """API routes for property valuation."""
 import logging
 
-from fastapi import APIRouter, HTTPException, status
-
-from app.models.request import ValuationRequest
-from app.models.response import ValuationResponse, ErrorResponse
+import orjson
+from fastapi import APIRouter, Response, status
+from fastapi.responses import ORJSONResponse
+
+from app.config import settings
+from app.models.request import BatchValuationRequest, ValuationRequest
+from app.models.response import (
+    BatchValuationResponse,
+    ErrorResponse,
+    ValuationResponse,
+)
+from app.services.batch_dispatcher import BatchedValuationDispatcher
 from app.services.valuation_engine import ValuationEngine
 
 # Configure logging
@@ -16,12 +24,31 @@ router = APIRouter(prefix="/api/v1", tags=["valuation"])
 # Initialize valuation engine
 valuation_engine = ValuationEngine()
 
+# Constant health check body, serialized once
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "valuation-service",
+    "version": "1.0.0"
+})
+
+# Coalesces concurrent /valuate calls; started and stopped by the app lifespan
+valuation_dispatcher = BatchedValuationDispatcher(
+    valuation_engine,
+    max_batch_size=settings.batch_max_size,
+    max_wait_ms=settings.batch_max_wait_ms
+)
+
 
 @router.post(
     "/valuate",
-    response_model=ValuationResponse,
+    response_model=None,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
     responses={
+        200: {
+            "model": ValuationResponse,
+            "description": "Successful Response"
+        },
         422: {
             "model": ErrorResponse,
             "description": "Validation Error"
@@ -37,7 +64,7 @@ valuation_engine = ValuationEngine()
         "property type, size, and age using a formula-based approach."
     )
 )
-async def valuate_property(request: ValuationRequest) -> ValuationResponse:
+async def valuate_property(request: ValuationRequest) -> ORJSONResponse:
     """
     Calculate property valuation.
 
@@ -45,42 +72,78 @@ async def valuate_property(request: ValuationRequest) -> ValuationResponse:
         request: ValuationRequest containing property details
 
     Returns:
-        ValuationResponse with estimated value and breakdown
+        JSON-encoded ValuationResponse with estimated value and breakdown
 
     Raises:
-        HTTPException: If valuation calculation fails
+        ValueError: If the engine rejects the inputs; mapped to 422 by the
+            app-level handler
     """
-    try:
+    log_info = logger.isEnabledFor(logging.INFO)
+    if log_info:
         logger.info(
             "Valuation request received: type=%s, size=%ssqft, age=%syrs",
             request.property_type, request.size_sqft, request.age_years
         )
 
-        # Calculate valuation
-        result = valuation_engine.calculate_value(
-            property_type=request.property_type,
-            size_sqft=request.size_sqft,
-            age_years=request.age_years
-        )
+    # Calculate valuation
+    result = await valuation_dispatcher.submit(request)
 
-        logger.info(
-            "Valuation calculated: $%s", f"{result.estimated_value:,.2f}"
-        )
+    if log_info:
+        logger.info("Valuation calculated: %s", result.estimated_value)
+
+    # The engine builds the response with model_construct (no validation);
+    # its validity rests on the engine's input checks and is covered by
+    # test_results_satisfy_response_model, so encode it directly
+    return ORJSONResponse(content=result.model_dump(mode="json"))
+
+
+@router.post(
+    "/valuate/batch",
+    response_model=None,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {
+            "model": BatchValuationResponse,
+            "description": "Successful Response"
+        },
+        422: {
+            "model": ErrorResponse,
+            "description": "Validation Error"
+        },
+        500: {
+            "model": ErrorResponse,
+            "description": "Internal Server Error"
+        }
+    },
+    summary="Calculate valuations for several properties",
+    description=(
+        "Calculate estimated values for up to 100 commercial properties in a "
+        "single request. Results are returned in request order."
+    )
+)
+async def valuate_batch(request: BatchValuationRequest) -> ORJSONResponse:
+    """
+    Calculate property valuations in bulk.
 
-        return result
+    Args:
+        request: BatchValuationRequest containing the properties to value
 
-    except ValueError as e:
-        logger.error("Validation error: %s", str(e))
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        ) from e
-    except Exception as e:
-        logger.error("Unexpected error during valuation: %s", str(e), exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error during valuation calculation"
-        ) from e
+    Returns:
+        JSON-encoded BatchValuationResponse, one result per item
+
+    Raises:
+        ValueError: If the engine rejects the inputs; mapped to 422 by the
+            app-level handler
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Batch valuation request received: items=%s", len(request.items))
+
+    results = valuation_engine.calculate_batch(request.items)
+
+    return ORJSONResponse(
+        content=BatchValuationResponse.model_construct(results=results).model_dump(mode="json")
+    )
 
 
 @router.get(
@@ -89,15 +152,11 @@ async def valuate_property(request: ValuationRequest) -> ValuationResponse:
     summary="Health check",
     description="Check if the valuation service is running"
 )
-async def health_check():
+async def health_check() -> Response:
     """
     Health check endpoint.
 
     Returns:
-        Status message
+        Pre-serialized status message
     """
-    return {
-        "status": "healthy",
-        "service": "valuation-service",
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -16,6 +16,11 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     reload: bool = True
+    access_log: bool = False
+
+    # Micro-batching of concurrent /valuate requests
+    batch_max_size: int = 64
+    batch_max_wait_ms: float = 0.0
 
     # CORS Settings
     allowed_origins: List[str] = ["http://localhost:3000"]
@@ -1,21 +1,35 @@
 """Main FastAPI application module."""
 import logging
+import logging.handlers
+import queue
 import sys
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
-from app.api.routes import router
-
-# Configure logging
+from app.api.routes import router, valuation_dispatcher
+from app.middleware import ETagMiddleware
+
+# Configure logging. Records are formatted and queued on the calling thread;
+# a background listener (started/stopped with the app) writes them to stdout,
+# keeping the write() syscall off the request path. force=True because
+# `python -m app.main` imports this module twice (as __main__ and via uvicorn)
+# and root must feed the queue whose listener the app actually starts.
+log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.StreamHandler(sys.stdout)
+)
 logging.basicConfig(
     level=getattr(logging, settings.log_level),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
+        logging.handlers.QueueHandler(log_queue)
+    ],
+    force=True
 )
 
 logger = logging.getLogger(__name__)
@@ -30,7 +44,15 @@ app = FastAPI(
     ),
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse
+)
+
+# Serve the constant GET endpoints from memory with ETag / 304 support.
+# Added before CORS so CORS stays outermost and still decorates cached replies.
+app.add_middleware(
+    ETagMiddleware,
+    paths=["/", f"{settings.api_prefix}/health", app.openapi_url]
 )
 
 # Configure CORS
@@ -46,22 +68,26 @@ app.add_middleware(
 app.include_router(router)
 
 
+# Constant root body, serialized once
+_ROOT_BODY = orjson.dumps({
+    "message": f"Welcome to {settings.app_name}",
+    "version": settings.app_version,
+    "docs": "/docs",
+    "health": "/api/v1/health"
+})
+
+
 @app.get("/", tags=["root"])
-async def root():
+async def root() -> Response:
     """Root endpoint."""
-    return {
-        "message": f"Welcome to {settings.app_name}",
-        "version": settings.app_version,
-        "docs": "/docs",
-        "health": "/api/v1/health"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.exception_handler(ValueError)
 async def value_error_handler(request, exc):  # pylint: disable=unused-argument
     """Handle ValueError exceptions."""
     logger.error("ValueError: %s", str(exc))
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "detail": str(exc),
@@ -73,8 +99,10 @@ async def value_error_handler(request, exc):  # pylint: disable=unused-argument
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):  # pylint: disable=unused-argument
     """Handle general exceptions."""
-    logger.error("Unhandled exception: %s", str(exc), exc_info=True)
-    return JSONResponse(
+    # No exc_info: Starlette re-raises after this handler and the server
+    # already logs the full traceback once
+    logger.error("Unhandled exception: %s: %s", type(exc).__name__, str(exc))
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error during valuation",
@@ -86,14 +114,18 @@ async def general_exception_handler(request, exc):  # pylint: disable=unused-arg
 @app.on_event("startup")
 async def startup_event():
     """Startup event handler."""
+    log_listener.start()
     logger.info("%s v%s starting up...", settings.app_name, settings.app_version)
     logger.info("Allowed origins: %s", settings.allowed_origins)
+    valuation_dispatcher.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Shutdown event handler."""
     logger.info("%s shutting down...", settings.app_name)
+    await valuation_dispatcher.stop()
+    log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -103,5 +135,6 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
+        access_log=settings.access_log,
         log_level=settings.log_level.lower()
     )
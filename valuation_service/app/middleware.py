@@ -0,0 +1,104 @@
+"""ASGI middleware for the valuation service."""
+import hashlib
+from typing import Dict, Iterable, List, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_Headers = List[Tuple[bytes, bytes]]
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag (quoted MD5 hex digest) for a response body."""
+    return f'"{hashlib.md5(body).hexdigest()}"'
+
+
+class ETagMiddleware:  # pylint: disable=too-few-public-methods
+    """
+    Serve constant GET endpoints from memory with ETag / 304 support.
+
+    The first successful response for each configured path is captured and
+    tagged with an MD5 ETag. Later requests are answered from the cached
+    bytes without reaching the route, or with ``304 Not Modified`` when the
+    client's ``If-None-Match`` already matches. Only use this for paths whose
+    response never changes while the process is running.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str]):
+        """
+        Wrap an ASGI app.
+
+        Args:
+            app: Downstream ASGI application
+            paths: Exact request paths whose GET responses may be cached
+        """
+        self.app = app
+        self.paths = frozenset(paths)
+        self._cache: Dict[str, Tuple[bytes, _Headers, bytes]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or scope["path"] not in self.paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        entry = self._cache.get(scope["path"])
+        if entry is None:
+            messages = await self._fetch(scope, receive)
+            if messages[0]["status"] != 200:
+                for message in messages:
+                    await send(message)
+                return
+            entry = self._cache[scope["path"]] = _build_entry(messages)
+
+        await _respond(scope, send, entry)
+
+    async def _fetch(self, scope: Scope, receive: Receive) -> List[Message]:
+        """Run the downstream app and collect every message it sends."""
+        messages: List[Message] = []
+
+        async def buffer(message: Message) -> None:
+            messages.append(message)
+
+        await self.app(scope, receive, buffer)
+        return messages
+
+
+def _build_entry(messages: List[Message]) -> Tuple[bytes, _Headers, bytes]:
+    """Turn a captured 200 response into an (etag, headers, body) cache entry."""
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    etag = etag_for(body).encode("latin-1")
+    headers = [
+        (name, value) for name, value in messages[0].get("headers", [])
+        if name != b"etag"
+    ]
+    headers.append((b"etag", etag))
+    return etag, headers, body
+
+
+async def _respond(scope: Scope, send: Send, entry: Tuple[bytes, _Headers, bytes]) -> None:
+    """Send a cached entry, or 304 if the client already holds it."""
+    etag, headers, body = entry
+
+    if _etag_matches(scope, etag):
+        await send({
+            "type": "http.response.start",
+            "status": 304,
+            "headers": [(b"etag", etag)]
+        })
+        await send({"type": "http.response.body", "body": b""})
+        return
+
+    await send({"type": "http.response.start", "status": 200, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _etag_matches(scope: Scope, etag: bytes) -> bool:
+    """Check the request's If-None-Match header against an ETag."""
+    for name, value in scope["headers"]:
+        if name == b"if-none-match":
+            candidates = [tag.strip() for tag in value.split(b",")]
+            return b"*" in candidates or etag in candidates or b"W/" + etag in candidates
+    return False
@@ -1,7 +1,12 @@
 """Request models for property valuation."""
 from enum import Enum
+from typing import List, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Maximum number of properties accepted by a single batch request
+MAX_BATCH_ITEMS = 100
 
 
 class PropertyType(str, Enum):
@@ -12,51 +17,71 @@ class PropertyType(str, Enum):
     INDUSTRIAL = "INDUSTRIAL"
 
 
+# PropertyType values as a Literal, so request validation is a string-in-set
+# check inside pydantic-core and the field stays a plain str. Keep in sync
+# with PropertyType.
+PropertyTypeName = Literal["MULTIFAMILY", "RETAIL", "OFFICE", "INDUSTRIAL"]
+
+
 class ValuationRequest(BaseModel):
     """Request model for property valuation."""
 
-    property_type: PropertyType = Field(
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "property_type": "MULTIFAMILY",
+                "size_sqft": 50000,
+                "age_years": 15
+            }
+        }
+    )
+
+    property_type: PropertyTypeName = Field(
         ...,
         description="Type of commercial property"
     )
     size_sqft: int = Field(
         ...,
         gt=0,
-        description="Property size in square feet"
+        le=10_000_000,
+        description="Property size in square feet (max 10M)"
     )
     age_years: int = Field(
         ...,
         ge=0,
-        description="Property age in years"
+        le=200,
+        description="Property age in years (max 200)"
     )
 
-    @field_validator('size_sqft')
-    @classmethod
-    def validate_size(cls, v: int) -> int:
-        """Validate property size is within acceptable range."""
-        if v <= 0:
-            raise ValueError("Property size must be greater than 0")
-        if v > 10_000_000:
-            raise ValueError("Property size exceeds maximum allowed (10M sqft)")
-        return v
-
-    @field_validator('age_years')
-    @classmethod
-    def validate_age(cls, v: int) -> int:
-        """Validate property age is within acceptable range."""
-        if v < 0:
-            raise ValueError("Property age cannot be negative")
-        if v > 200:
-            raise ValueError("Property age exceeds reasonable limit (200 years)")
-        return v
-
-    class Config:  # pylint: disable=too-few-public-methods
-        """Pydantic configuration."""
-        use_enum_values = True
-        json_schema_extra = {
+
+class BatchValuationRequest(BaseModel):
+    """Request model for valuing several properties in one call."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        json_schema_extra={
             "example": {
-                "property_type": "MULTIFAMILY",
-                "size_sqft": 50000,
-                "age_years": 15
+                "items": [
+                    {
+                        "property_type": "MULTIFAMILY",
+                        "size_sqft": 50000,
+                        "age_years": 15
+                    },
+                    {
+                        "property_type": "OFFICE",
+                        "size_sqft": 25000,
+                        "age_years": 5
+                    }
+                ]
             }
         }
+    )
+
+    items: List[ValuationRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+        description=f"Properties to value (1-{MAX_BATCH_ITEMS} per request)"
+    )
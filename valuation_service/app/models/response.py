@@ -1,6 +1,6 @@
 """Response models for property valuation."""
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -33,7 +33,7 @@ class ValuationResponse(BaseModel):
         description="Estimated property value in dollars"
     )
     valuation_date: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Timestamp of valuation calculation"
     )
     methodology: str = Field(
@@ -61,6 +61,15 @@ class ValuationResponse(BaseModel):
         }
 
 
+class BatchValuationResponse(BaseModel):
+    """Response model for batch property valuation."""
+
+    results: List[ValuationResponse] = Field(
+        ...,
+        description="Valuations in the same order as the request items"
+    )
+
+
 class ErrorResponse(BaseModel):
     """Error response model."""
 
@@ -0,0 +1,153 @@
+"""Micro-batching dispatcher for concurrent valuation requests."""
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from app.models.request import ValuationRequest
+from app.models.response import ValuationResponse
+from app.services.valuation_engine import ValuationEngine
+
+logger = logging.getLogger(__name__)
+
+_PendingValuation = Tuple[ValuationRequest, "asyncio.Future[ValuationResponse]"]
+
+
+class BatchedValuationDispatcher:
+    """
+    Coalesce concurrent single-property valuations into engine batches.
+
+    Callers submit a request and await its result. A background worker takes
+    the first queued request, gives other in-flight requests up to
+    ``max_wait_ms`` to join it, then values up to ``max_batch_size`` of them
+    with a single ``ValuationEngine.calculate_batch`` call.
+
+    Until ``start`` is called (or after ``stop``), ``submit`` values requests
+    directly so the dispatcher is safe to use without an application
+    lifespan, e.g. from a plain ``TestClient``.
+    """
+
+    def __init__(
+        self,
+        engine: ValuationEngine,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 0.0
+    ):
+        """
+        Create a dispatcher.
+
+        Args:
+            engine: Engine used to value each batch
+            max_batch_size: Maximum number of requests valued per batch
+            max_wait_ms: How long the worker waits for more requests to join
+                a batch; 0 only picks up requests that are already queued
+        """
+        self._engine = engine
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._queue: Optional["asyncio.Queue[_PendingValuation]"] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background worker is accepting requests."""
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        """Start the background worker on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.get_running_loop().create_task(self._run(self._queue))
+
+    async def stop(self) -> None:
+        """Stop the background worker, valuing any requests still queued."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        queue, self._queue = self._queue, None
+        pending: List[_PendingValuation] = []
+        while queue is not None and not queue.empty():
+            pending.append(queue.get_nowait())
+        # Callers already in flight at shutdown still get their results
+        self._dispatch(pending)
+
+    async def submit(self, request: ValuationRequest) -> ValuationResponse:
+        """
+        Value a single property, sharing a batch with concurrent callers.
+
+        Args:
+            request: Validated valuation request
+
+        Returns:
+            ValuationResponse for the request
+
+        Raises:
+            ValueError: If the request inputs are invalid
+        """
+        queue = self._queue
+        if queue is None or not self.running:
+            return self._engine.calculate_value(
+                property_type=request.property_type,
+                size_sqft=request.size_sqft,
+                age_years=request.age_years
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((request, future))
+        return await future
+
+    async def _run(self, queue: "asyncio.Queue[_PendingValuation]") -> None:
+        """Worker loop: collect a batch from ``queue``, value it, repeat."""
+        while True:
+            batch = [await queue.get()]
+
+            # Let requests that are already in flight enqueue before draining
+            try:
+                await asyncio.sleep(self._max_wait)
+            except asyncio.CancelledError:
+                self._dispatch(batch)
+                raise
+            while len(batch) < self._max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[_PendingValuation]) -> None:
+        """Value a batch and resolve each caller's future."""
+        pending = [(request, future) for request, future in batch if not future.done()]
+        if not pending:
+            return
+
+        try:
+            results = self._engine.calculate_batch([request for request, _ in pending])
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Value items one at a time so an error only reaches its caller
+            logger.warning("Batch of %s valuations failed, retrying individually",
+                           len(pending))
+            for request, future in pending:
+                self._resolve_single(request, future)
+            return
+
+        for (_, future), result in zip(pending, results):
+            future.set_result(result)
+
+    def _resolve_single(
+        self,
+        request: ValuationRequest,
+        future: "asyncio.Future[ValuationResponse]"
+    ) -> None:
+        """Value one request and resolve its future with the result or error."""
+        try:
+            future.set_result(self._engine.calculate_value(
+                property_type=request.property_type,
+                size_sqft=request.size_sqft,
+                age_years=request.age_years
+            ))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            future.set_exception(e)
@@ -1,10 +1,138 @@
 """Valuation engine for calculating property values."""
-from datetime import datetime
-from decimal import Decimal, ROUND_HALF_UP
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Sequence
 
-from app.models.request import PropertyType
+from app.models.request import PropertyType, ValuationRequest
 from app.models.response import ValuationResponse, ValuationBreakdown
 
+# Base rates per square foot, keyed by plain property type string
+BASE_RATES = {
+    PropertyType.MULTIFAMILY.value: 200.0,  # $200/sqft
+    PropertyType.RETAIL.value: 150.0,       # $150/sqft
+    PropertyType.OFFICE.value: 180.0,       # $180/sqft
+    PropertyType.INDUSTRIAL.value: 100.0,   # $100/sqft
+}
+
+# Depreciation constants
+MAX_DEPRECIATION = 0.40      # Maximum 40% depreciation
+ANNUAL_DEPRECIATION = 0.01   # 1% per year
+
+
+def _rate_entry(
+    property_type: str,
+    age_years: int
+) -> tuple[float, float, str]:
+    """
+    Compute the size-independent part of a valuation.
+
+    Args:
+        property_type: Type of commercial property
+        age_years: Property age in years
+
+    Returns:
+        Tuple of (base_rate, depreciation_factor, methodology)
+    """
+    # Get base rate for property type
+    base_rate = BASE_RATES[property_type]
+
+    # Calculate depreciation (1% per year, max 40%)
+    depreciation_factor = _depreciation(age_years)
+
+    # Generate methodology description. Interned so every age past the
+    # depreciation cap shares one string object per property type.
+    depreciation_percent = depreciation_factor * 100
+    methodology = sys.intern(
+        f"Base rate (${base_rate:g}/sqft) with "
+        f"{depreciation_percent:.1f}% age depreciation"
+    )
+
+    return base_rate, depreciation_factor, methodology
+
+
+def _depreciation(age_years: int) -> float:
+    """Depreciation factor for an age, rounded so 35 * 0.01 yields 0.35."""
+    return round(min(age_years * ANNUAL_DEPRECIATION, MAX_DEPRECIATION), 2)
+
+
+# Every (property_type, age_years) pair accepted by ValuationRequest (ages
+# 0-200), precomputed at import; other ages fall back to _rate_entry
+_RATE_TABLE: dict[tuple[str, int], tuple[float, float, str]] = {
+    (property_type, age_years): _rate_entry(property_type, age_years)
+    for property_type in BASE_RATES
+    for age_years in range(0, 201)
+}
+
+
+@lru_cache(maxsize=4096)
+def _compute(
+    property_type: str,
+    size_sqft: int,
+    age_years: int
+) -> tuple[float, float, float, str]:
+    """
+    Run the valuation formula, memoized on its inputs.
+
+    Args:
+        property_type: Type of commercial property
+        size_sqft: Property size in square feet
+        age_years: Property age in years
+
+    Returns:
+        Tuple of (base_value, depreciation_factor, final_value, methodology)
+    """
+    # Look up base rate, depreciation and methodology for (type, age)
+    entry = _RATE_TABLE.get((property_type, age_years))
+    if entry is None:
+        entry = _rate_entry(property_type, age_years)
+    base_rate, depreciation_factor, methodology = entry
+
+    # Calculate base and final value
+    base_value = size_sqft * base_rate
+    estimated_value = base_value * (1.0 - depreciation_factor)
+
+    # Round to 2 decimal places
+    return (
+        round(base_value, 2),
+        depreciation_factor,
+        round(estimated_value, 2),
+        methodology
+    )
+
+
+def _build_response(
+    property_type: str,
+    size_sqft: int,
+    age_years: int,
+    valuation_date: datetime
+) -> ValuationResponse:
+    """Validate inputs and assemble the ValuationResponse for one property."""
+    # Validate inputs
+    if size_sqft <= 0:
+        raise ValueError("Property size must be greater than 0")
+    if age_years < 0:
+        raise ValueError("Property age cannot be negative")
+
+    base_value, depreciation_factor, estimated_value, methodology = (
+        _compute(property_type, size_sqft, age_years)
+    )
+
+    # The formula only produces valid values, so build the models without
+    # running pydantic validation
+    breakdown = ValuationBreakdown.model_construct(
+        base_value=base_value,
+        depreciation_factor=depreciation_factor,
+        final_value=estimated_value
+    )
+
+    return ValuationResponse.model_construct(
+        estimated_value=estimated_value,
+        valuation_date=valuation_date,
+        methodology=methodology,
+        breakdown=breakdown
+    )
+
 
 class ValuationEngine:
     """
@@ -14,23 +142,20 @@ class ValuationEngine:
     1. Base value = size_sqft * base_rate[property_type]
     2. Depreciation = min(age_years * 0.01, 0.40)  # 1% per year, max 40%
     3. Final value = base_value * (1 - depreciation)
+
+    The engine is stateless; the constants and formula live at module level
+    and the methods are static.
     """
 
-    # Base rates per square foot for different property types
-    BASE_RATES = {
-        PropertyType.MULTIFAMILY: Decimal("200"),  # $200/sqft
-        PropertyType.RETAIL: Decimal("150"),       # $150/sqft
-        PropertyType.OFFICE: Decimal("180"),       # $180/sqft
-        PropertyType.INDUSTRIAL: Decimal("100"),   # $100/sqft
-    }
+    __slots__ = ()
 
-    # Depreciation constants
-    MAX_DEPRECIATION = Decimal("0.40")      # Maximum 40% depreciation
-    ANNUAL_DEPRECIATION = Decimal("0.01")   # 1% per year
+    BASE_RATES = BASE_RATES
+    MAX_DEPRECIATION = MAX_DEPRECIATION
+    ANNUAL_DEPRECIATION = ANNUAL_DEPRECIATION
 
+    @staticmethod
     def calculate_value(
-        self,
-        property_type: PropertyType,
+        property_type: str,
         size_sqft: int,
         age_years: int
     ) -> ValuationResponse:
@@ -48,60 +173,42 @@ class ValuationEngine:
         Raises:
             ValueError: If inputs are invalid
         """
-        # Validate inputs
-        if size_sqft <= 0:
-            raise ValueError("Property size must be greater than 0")
-        if age_years < 0:
-            raise ValueError("Property age cannot be negative")
-
-        # Get base rate for property type
-        base_rate = self.BASE_RATES[property_type]
-
-        # Calculate base value
-        base_value = Decimal(size_sqft) * base_rate
-
-        # Calculate depreciation (1% per year, max 40%)
-        depreciation_factor = min(
-            Decimal(age_years) * self.ANNUAL_DEPRECIATION,
-            self.MAX_DEPRECIATION
+        return _build_response(
+            property_type, size_sqft, age_years, datetime.now(timezone.utc)
         )
 
-        # Calculate final value
-        estimated_value = base_value * (Decimal("1") - depreciation_factor)
-
-        # Round to 2 decimal places
-        estimated_value = estimated_value.quantize(
-            Decimal("0.01"),
-            rounding=ROUND_HALF_UP
-        )
-        base_value = base_value.quantize(
-            Decimal("0.01"),
-            rounding=ROUND_HALF_UP
-        )
+    @staticmethod
+    def calculate_batch(
+        requests: Sequence[ValuationRequest]
+    ) -> List[ValuationResponse]:
+        """
+        Calculate estimated values for several properties at once.
 
-        # Create breakdown
-        breakdown = ValuationBreakdown(
-            base_value=float(base_value),
-            depreciation_factor=float(depreciation_factor),
-            final_value=float(estimated_value)
-        )
+        All results share a single valuation_date, so the clock is read once
+        per batch rather than once per property.
 
-        # Generate methodology description
-        depreciation_percent = float(depreciation_factor) * 100
-        methodology = (
-            f"Base rate (${base_rate}/sqft) with "
-            f"{depreciation_percent:.1f}% age depreciation"
-        )
+        Args:
+            requests: Validated valuation requests
 
-        # Return response
-        return ValuationResponse(
-            estimated_value=float(estimated_value),
-            valuation_date=datetime.utcnow(),
-            methodology=methodology,
-            breakdown=breakdown
-        )
+        Returns:
+            ValuationResponse for each request, in the same order
 
-    def get_base_rate(self, property_type: PropertyType) -> Decimal:
+        Raises:
+            ValueError: If any input is invalid
+        """
+        valuation_date = datetime.now(timezone.utc)
+        return [
+            _build_response(
+                request.property_type,
+                request.size_sqft,
+                request.age_years,
+                valuation_date
+            )
+            for request in requests
+        ]
+
+    @staticmethod
+    def get_base_rate(property_type: str) -> float:
         """
         Get the base rate per square foot for a property type.
 
@@ -109,11 +216,12 @@ class ValuationEngine:
             property_type: Type of commercial property
 
         Returns:
-            Base rate per square foot as Decimal
+            Base rate per square foot
         """
-        return self.BASE_RATES[property_type]
+        return BASE_RATES[property_type]
 
-    def calculate_depreciation(self, age_years: int) -> Decimal:
+    @staticmethod
+    def calculate_depreciation(age_years: int) -> float:
         """
         Calculate depreciation factor based on property age.
 
@@ -121,12 +229,9 @@ class ValuationEngine:
             age_years: Property age in years
 
         Returns:
-            Depreciation factor (0-0.40) as Decimal
+            Depreciation factor (0-0.40), rounded to 2 decimal places
         """
         if age_years < 0:
             raise ValueError("Property age cannot be negative")
 
-        return min(
-            Decimal(age_years) * self.ANNUAL_DEPRECIATION,
-            self.MAX_DEPRECIATION
-        )
+        return _depreciation(age_years)
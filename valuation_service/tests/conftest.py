@@ -0,0 +1,18 @@
+"""Shared pytest configuration for the valuation service tests."""
+from app.models.request import BatchValuationRequest, ValuationRequest
+from app.models.response import (
+    BatchValuationResponse,
+    ValuationBreakdown,
+    ValuationResponse,
+)
+
+# Make sure every model's validator is built while the test modules are
+# collected, not during whichever test happens to use the model first.
+for _model in (
+    ValuationRequest,
+    BatchValuationRequest,
+    ValuationBreakdown,
+    ValuationResponse,
+    BatchValuationResponse,
+):
+    _model.model_rebuild()
@@ -1,18 +1,61 @@
 """Tests for FastAPI endpoints."""
+import asyncio
+
+import httpx
+import orjson
 import pytest
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
 
+from app.api import routes
+from app.api.routes import valuation_dispatcher
+from app.config import settings
 from app.main import app
+from app.middleware import etag_for
+
+# Bodies posted repeatedly are serialized once at import
+_JSON_HEADERS = {"content-type": "application/json"}
+_OFFICE_PAYLOAD = orjson.dumps({
+    "property_type": "OFFICE",
+    "size_sqft": 15000,
+    "age_years": 12
+})
+_AGE_COMPARISON_AGES = (0, 10, 20, 40, 60)
+_AGE_COMPARISON_PAYLOADS = tuple(
+    orjson.dumps({"property_type": "MULTIFAMILY", "size_sqft": 30000, "age_years": age})
+    for age in _AGE_COMPARISON_AGES
+)
+
+
+@pytest.fixture(scope="module", name="client")
+def fixture_client():
+    """Create a test client whose app lifespan spans the whole module."""
+    # Entering the client runs startup once, so /valuate goes through the
+    # micro-batching dispatcher as it does in production
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session", name="openapi_schema")
+def fixture_openapi_schema():
+    """Build the OpenAPI schema once; FastAPI caches it on the app."""
+    return app.openapi()
+
+
+async def _post_concurrently(path, payloads):
+    """POST each pre-serialized payload to ``path`` at once over ASGITransport."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(*[
+            client.post(path, content=payload, headers=_JSON_HEADERS)
+            for payload in payloads
+        ])
 
 
 class TestAPI:  # pylint: disable=too-many-public-methods
     """Test suite for FastAPI endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a test client."""
-        return TestClient(app)
-
     def test_root_endpoint(self, client):
         """Test root endpoint."""
         response = client.get("/")
@@ -30,12 +73,56 @@ class TestAPI:  # pylint: disable=too-many-public-methods
         assert data["status"] == "healthy"
         assert data["service"] == "valuation-service"
 
-    def test_valuate_multifamily_success(self, client):
-        """Test successful valuation request for multifamily property."""
+    @pytest.mark.parametrize("path", ["/", "/api/v1/health", "/openapi.json"])
+    def test_static_endpoints_send_etag(self, client, path):
+        """Test that constant GET endpoints return an ETag and honour If-None-Match."""
+        first = client.get(path)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        repeat = client.get(path)
+        assert repeat.status_code == 200
+        assert repeat.headers["etag"] == etag
+        assert repeat.content == first.content
+
+        not_modified = client.get(path, headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == etag
+        assert not_modified.content == b""
+
+    def test_health_etag_matches_body(self, client):
+        """Test that the health ETag is the digest of the body actually sent."""
+        response = client.get("/api/v1/health")
+        assert response.headers["etag"] == etag_for(response.content)
+        assert response.headers["content-type"] == "application/json"
+
+    def test_stale_etag_returns_full_response(self, client):
+        """Test that a non-matching If-None-Match gets the full body."""
+        response = client.get("/api/v1/health", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+
+    @pytest.mark.parametrize(
+        "ptype,size,age,expected",
+        [
+            # Base: 50,000 * $200 = $10,000,000; 15% depreciation
+            ("MULTIFAMILY", 50000, 15, 8_500_000.00),
+            # Base: 10,000 * $150 = $1,500,000; 10% depreciation
+            ("RETAIL", 10000, 10, 1_350_000.00),
+            # Base: 25,000 * $180 = $4,500,000; 5% depreciation
+            ("OFFICE", 25000, 5, 4_275_000.00),
+            # Base: 100,000 * $100 = $10,000,000; 20% depreciation
+            ("INDUSTRIAL", 100000, 20, 8_000_000.00),
+        ]
+    )
+    def test_valuate_success(  # pylint: disable=too-many-arguments
+        self, client, ptype, size, age, expected
+    ):
+        """Test successful valuation request for each property type."""
         payload = {
-            "property_type": "MULTIFAMILY",
-            "size_sqft": 50000,
-            "age_years": 15
+            "property_type": ptype,
+            "size_sqft": size,
+            "age_years": age
         }
 
         response = client.post("/api/v1/valuate", json=payload)
@@ -47,169 +134,135 @@ class TestAPI:  # pylint: disable=too-many-public-methods
         assert "methodology" in data
         assert "breakdown" in data
 
-        # Verify calculation
-        # Base: 50,000 * $200 = $10,000,000
-        # Depreciation: 15%
-        # Final: $10,000,000 * 0.85 = $8,500,000
-        assert data["estimated_value"] == 8_500_000.00
-        assert data["breakdown"]["base_value"] == 10_000_000.00
-        assert data["breakdown"]["depreciation_factor"] == 0.15
+        assert data["estimated_value"] == expected
+        assert data["breakdown"]["depreciation_factor"] == age / 100
 
-    def test_valuate_retail_success(self, client):
-        """Test successful valuation request for retail property."""
-        payload = {
-            "property_type": "RETAIL",
-            "size_sqft": 10000,
-            "age_years": 10
-        }
-
-        response = client.post("/api/v1/valuate", json=payload)
-        assert response.status_code == 200
-
-        data = response.json()
-        # Base: 10,000 * $150 = $1,500,000
-        # Depreciation: 10%
-        # Final: $1,500,000 * 0.90 = $1,350,000
-        assert data["estimated_value"] == 1_350_000.00
-
-    def test_valuate_office_success(self, client):
-        """Test successful valuation request for office property."""
+    def test_valuate_with_lifespan(self, client):
+        """Test valuation through the micro-batching dispatcher."""
         payload = {
             "property_type": "OFFICE",
             "size_sqft": 25000,
             "age_years": 5
         }
 
+        # The module client's startup event started the dispatcher
+        assert valuation_dispatcher.running
         response = client.post("/api/v1/valuate", json=payload)
-        assert response.status_code == 200
 
-        data = response.json()
-        # Base: 25,000 * $180 = $4,500,000
-        # Depreciation: 5%
-        # Final: $4,500,000 * 0.95 = $4,275,000
-        assert data["estimated_value"] == 4_275_000.00
-
-    def test_valuate_industrial_success(self, client):
-        """Test successful valuation request for industrial property."""
-        payload = {
-            "property_type": "INDUSTRIAL",
-            "size_sqft": 100000,
-            "age_years": 20
-        }
-
-        response = client.post("/api/v1/valuate", json=payload)
         assert response.status_code == 200
+        assert response.json()["estimated_value"] == 4_275_000.00
 
-        data = response.json()
-        # Base: 100,000 * $100 = $10,000,000
-        # Depreciation: 20%
-        # Final: $10,000,000 * 0.80 = $8,000,000
-        assert data["estimated_value"] == 8_000_000.00
-
-    def test_valuate_new_building(self, client):
-        """Test valuation of new building (age 0)."""
+    def test_valuate_batch_success(self, client):
+        """Test batch valuation returns one result per item, in order."""
         payload = {
-            "property_type": "MULTIFAMILY",
-            "size_sqft": 20000,
-            "age_years": 0
+            "items": [
+                {"property_type": "MULTIFAMILY", "size_sqft": 50000, "age_years": 15},
+                {"property_type": "RETAIL", "size_sqft": 10000, "age_years": 10},
+                {"property_type": "INDUSTRIAL", "size_sqft": 100000, "age_years": 60}
+            ]
         }
 
-        response = client.post("/api/v1/valuate", json=payload)
+        response = client.post("/api/v1/valuate/batch", json=payload)
         assert response.status_code == 200
 
-        data = response.json()
-        # No depreciation for new building
-        assert data["breakdown"]["depreciation_factor"] == 0.0
-        assert data["estimated_value"] == data["breakdown"]["base_value"]
-
-    def test_valuate_invalid_property_type(self, client):
-        """Test valuation with invalid property type."""
-        payload = {
-            "property_type": "RESIDENTIAL",  # Invalid type
-            "size_sqft": 10000,
-            "age_years": 10
-        }
-
-        response = client.post("/api/v1/valuate", json=payload)
-        assert response.status_code == 422  # Validation error
-
-    def test_valuate_zero_size(self, client):
-        """Test valuation with zero size."""
-        payload = {
-            "property_type": "OFFICE",
-            "size_sqft": 0,
-            "age_years": 10
-        }
+        results = response.json()["results"]
+        assert [r["estimated_value"] for r in results] == [
+            8_500_000.00, 1_350_000.00, 6_000_000.00
+        ]
+        assert results[2]["breakdown"]["depreciation_factor"] == 0.40
+        # All items in a batch share one valuation timestamp
+        assert len({r["valuation_date"] for r in results}) == 1
+
+    def test_valuate_batch_empty(self, client):
+        """Test that an empty batch is rejected."""
+        response = client.post("/api/v1/valuate/batch", json={"items": []})
+        assert response.status_code == 422
 
-        response = client.post("/api/v1/valuate", json=payload)
+    def test_valuate_batch_too_large(self, client):
+        """Test that batches above the item limit are rejected."""
+        item = {"property_type": "OFFICE", "size_sqft": 10000, "age_years": 10}
+        response = client.post("/api/v1/valuate/batch", json={"items": [item] * 101})
         assert response.status_code == 422
 
-    def test_valuate_negative_size(self, client):
-        """Test valuation with negative size."""
+    def test_valuate_batch_invalid_item(self, client):
+        """Test that one invalid item rejects the whole batch."""
         payload = {
-            "property_type": "OFFICE",
-            "size_sqft": -5000,
-            "age_years": 10
+            "items": [
+                {"property_type": "OFFICE", "size_sqft": 10000, "age_years": 10},
+                {"property_type": "OFFICE", "size_sqft": 0, "age_years": 10}
+            ]
         }
 
-        response = client.post("/api/v1/valuate", json=payload)
+        response = client.post("/api/v1/valuate/batch", json=payload)
         assert response.status_code == 422
 
-    def test_valuate_negative_age(self, client):
-        """Test valuation with negative age."""
+    def test_engine_value_error_returns_422(self, client, monkeypatch):
+        """Test that a ValueError from the engine is reported as a 422."""
+        def reject(requests):
+            raise ValueError(f"Cannot value {len(requests)} properties")
+
+        monkeypatch.setattr(type(routes.valuation_engine), "calculate_batch",
+                            staticmethod(reject))
         payload = {
-            "property_type": "RETAIL",
-            "size_sqft": 10000,
-            "age_years": -5
+            "items": [{"property_type": "OFFICE", "size_sqft": 10000, "age_years": 10}]
         }
 
-        response = client.post("/api/v1/valuate", json=payload)
+        response = client.post("/api/v1/valuate/batch", json=payload)
         assert response.status_code == 422
-
-    def test_valuate_missing_field(self, client):
-        """Test valuation with missing required field."""
-        payload = {
-            "property_type": "OFFICE",
-            "size_sqft": 10000
-            # Missing age_years
+        assert response.json() == {
+            "detail": "Cannot value 1 properties",
+            "error_code": "VALIDATION_ERROR"
         }
 
-        response = client.post("/api/v1/valuate", json=payload)
-        assert response.status_code == 422
+    def test_unexpected_error_returns_500(self, monkeypatch):
+        """Test that an unexpected engine error is reported as a 500."""
+        def explode(requests):
+            raise RuntimeError(f"Rate table unavailable for {len(requests)} items")
 
-    def test_valuate_invalid_type_string_for_size(self, client):
-        """Test valuation with invalid type for size_sqft."""
+        monkeypatch.setattr(type(routes.valuation_engine), "calculate_batch",
+                            staticmethod(explode))
         payload = {
-            "property_type": "OFFICE",
-            "size_sqft": "ten thousand",  # Should be int
-            "age_years": 10
+            "items": [{"property_type": "OFFICE", "size_sqft": 10000, "age_years": 10}]
         }
 
-        response = client.post("/api/v1/valuate", json=payload)
-        assert response.status_code == 422
+        error_client = TestClient(app, raise_server_exceptions=False)
+        response = error_client.post("/api/v1/valuate/batch", json=payload)
+        assert response.status_code == 500
+        assert response.json() == {
+            "detail": "Internal server error during valuation",
+            "error_code": "INTERNAL_ERROR"
+        }
 
-    def test_valuate_extremely_large_size(self, client):
-        """Test valuation with extremely large size."""
+    def test_valuate_new_building(self, client):
+        """Test valuation of new building (age 0)."""
         payload = {
-            "property_type": "INDUSTRIAL",
-            "size_sqft": 15_000_000,  # Exceeds max allowed
-            "age_years": 10
+            "property_type": "MULTIFAMILY",
+            "size_sqft": 20000,
+            "age_years": 0
         }
 
         response = client.post("/api/v1/valuate", json=payload)
-        assert response.status_code == 422
+        assert response.status_code == 200
 
-    def test_valuate_extremely_old_building(self, client):
-        """Test valuation with extremely old building."""
-        payload = {
-            "property_type": "OFFICE",
-            "size_sqft": 10000,
-            "age_years": 250  # Exceeds reasonable limit
-        }
+        data = response.json()
+        # No depreciation for new building
+        assert data["breakdown"]["depreciation_factor"] == 0.0
+        assert data["estimated_value"] == data["breakdown"]["base_value"]
+
+    def test_valuate_invalid_payload(self, client):
+        """Test that a payload failing request validation is rejected with 422."""
+        # Individual validation rules are covered by TestValuationRequest
+        payload = {"property_type": "RESIDENTIAL", "size_sqft": 0, "age_years": 10}
 
         response = client.post("/api/v1/valuate", json=payload)
         assert response.status_code == 422
 
+        errors = response.json()["detail"]
+        assert [error["loc"] for error in errors] == [
+            ["body", "property_type"],
+            ["body", "size_sqft"]
+        ]
+
     def test_valuate_max_depreciation(self, client):
         """Test that depreciation is capped at 40%."""
         payload = {
@@ -225,26 +278,53 @@ class TestAPI:  # pylint: disable=too-many-public-methods
         # Depreciation should be capped at 40%
         assert data["breakdown"]["depreciation_factor"] == 0.40
 
-    def test_openapi_docs_available(self, client):
+    def test_openapi_docs_available(self, client, openapi_schema):
         """Test that OpenAPI documentation is available."""
         response = client.get("/openapi.json")
         assert response.status_code == 200
+        assert response.json() == openapi_schema
 
-        openapi = response.json()
+        openapi = openapi_schema
         assert openapi["info"]["title"] == "Property Valuation Service"
         assert "/api/v1/valuate" in openapi["paths"]
+        assert "/api/v1/valuate/batch" in openapi["paths"]
         assert "/api/v1/health" in openapi["paths"]
 
-    def test_cors_headers(self, client):
-        """Test that CORS headers are properly configured."""
-        headers = {
-            "Origin": "http://localhost:3000",
-            "Access-Control-Request-Method": "POST"
-        }
-
-        response = client.options("/api/v1/valuate", headers=headers)
-        # FastAPI's CORS middleware handles OPTIONS requests
-        assert response.status_code in [200, 204]
+    @pytest.mark.parametrize(
+        "path,model",
+        [
+            ("/api/v1/valuate", "ValuationResponse"),
+            ("/api/v1/valuate/batch", "BatchValuationResponse"),
+        ]
+    )
+    def test_openapi_documents_response_model(self, openapi_schema, path, model):
+        """Test that routes returning pre-encoded JSON still document their model."""
+        response_200 = openapi_schema["paths"][path]["post"]["responses"]["200"]
+        schema = response_200["content"]["application/json"]["schema"]
+        assert schema == {"$ref": f"#/components/schemas/{model}"}
+        assert model in openapi_schema["components"]["schemas"]
+
+    def test_routes_registered_once(self):
+        """Test that each API route is mounted exactly once."""
+        api_routes = [
+            (route.path, method)
+            for route in app.routes if isinstance(route, APIRoute)
+            for method in route.methods
+        ]
+
+        assert sorted(api_routes) == [
+            ("/", "GET"),
+            ("/api/v1/health", "GET"),
+            ("/api/v1/valuate", "POST"),
+            ("/api/v1/valuate/batch", "POST")
+        ]
+
+    def test_cors_configured(self):
+        """Test that CORS is the outermost middleware, with the configured origins."""
+        cors = app.user_middleware[0]
+        assert cors.cls is CORSMiddleware
+        assert cors.options["allow_origins"] == settings.allowed_origins
+        assert cors.options["allow_methods"] == settings.allowed_methods
 
     def test_response_structure(self, client):
         """Test that response has correct structure."""
@@ -274,22 +354,33 @@ class TestAPI:  # pylint: disable=too-many-public-methods
         # Verify depreciation_factor is between 0 and 1
         assert 0 <= breakdown["depreciation_factor"] <= 1
 
-    def test_multiple_requests(self, client):
-        """Test multiple sequential requests."""
-        payload = {
-            "property_type": "OFFICE",
-            "size_sqft": 15000,
-            "age_years": 12
-        }
+    def test_multiple_requests(self, client, monkeypatch):
+        """Test multiple concurrent requests."""
+        batch_sizes = []
+        calculate_batch = type(routes.valuation_engine).calculate_batch
+
+        def record(requests):
+            batch_sizes.append(len(requests))
+            return calculate_batch(requests)
+
+        monkeypatch.setattr(type(routes.valuation_engine), "calculate_batch",
+                            staticmethod(record))
+        assert valuation_dispatcher.running
 
-        # Make multiple requests
-        for _ in range(3):
-            response = client.post("/api/v1/valuate", json=payload)
+        # Make multiple requests on the loop the dispatcher's worker runs on
+        responses = client.portal.call(
+            _post_concurrently, "/api/v1/valuate", [_OFFICE_PAYLOAD] * 3
+        )
+
+        for response in responses:
             assert response.status_code == 200
 
             data = response.json()
             assert data["estimated_value"] > 0
 
+        # Every request was valued by the dispatcher's worker
+        assert sum(batch_sizes) == 3
+
     def test_newer_property_valued_higher_than_older_api(self, client):
         """
         Test business requirement via API: A new property with the same
@@ -347,18 +438,14 @@ class TestAPI:  # pylint: disable=too-many-public-methods
         Test that age consistently affects value across different scenarios via API.
         Compare properties at different ages to ensure correct ordering.
         """
-        base_payload = {
-            "property_type": "MULTIFAMILY",
-            "size_sqft": 30000
-        }
-
-        # Test with multiple ages
-        ages = [0, 10, 20, 40, 60]
+        # Test a 30,000 sqft multifamily property at multiple ages
         results = []
 
-        for age in ages:
-            payload = {**base_payload, "age_years": age}
-            response = client.post("/api/v1/valuate", json=payload)
+        responses = client.portal.call(
+            _post_concurrently, "/api/v1/valuate", _AGE_COMPARISON_PAYLOADS
+        )
+
+        for age, response in zip(_AGE_COMPARISON_AGES, responses):
             assert response.status_code == 200
             data = response.json()
             results.append({
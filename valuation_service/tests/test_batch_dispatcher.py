@@ -0,0 +1,127 @@
+"""Tests for the micro-batching valuation dispatcher."""
+import asyncio
+
+import pytest
+
+from app.models.request import PropertyType, ValuationRequest
+from app.services.batch_dispatcher import BatchedValuationDispatcher
+from app.services.valuation_engine import ValuationEngine
+
+
+class RecordingEngine:  # pylint: disable=too-few-public-methods
+    """Wraps ValuationEngine and records the size of every batch it values."""
+
+    calculate_value = staticmethod(ValuationEngine.calculate_value)
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def calculate_batch(self, requests):
+        """Record the batch size, then value the batch."""
+        self.batch_sizes.append(len(requests))
+        return ValuationEngine.calculate_batch(requests)
+
+
+def make_request(size_sqft=10000, age_years=10):
+    """Build a valid office valuation request."""
+    return ValuationRequest(
+        property_type=PropertyType.OFFICE.value,
+        size_sqft=size_sqft,
+        age_years=age_years
+    )
+
+
+class TestBatchedValuationDispatcher:
+    """Test suite for BatchedValuationDispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_submit_without_worker_values_directly(self):
+        """Test that submit works before the worker is started."""
+        engine = RecordingEngine()
+        dispatcher = BatchedValuationDispatcher(engine)
+
+        result = await dispatcher.submit(make_request())
+
+        # Base: 10,000 * $180 = $1,800,000; 10% depreciation
+        assert result.estimated_value == 1_620_000.00
+        assert not dispatcher.running
+        assert not engine.batch_sizes
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_a_batch(self):
+        """Test that concurrent submissions are valued in one batch."""
+        engine = RecordingEngine()
+        dispatcher = BatchedValuationDispatcher(engine)
+        dispatcher.start()
+        try:
+            results = await asyncio.gather(*[
+                dispatcher.submit(make_request(size_sqft=1000 * (i + 1)))
+                for i in range(10)
+            ])
+        finally:
+            await dispatcher.stop()
+
+        assert engine.batch_sizes == [10]
+        # Results come back to the caller that submitted each request
+        assert [r.breakdown.base_value for r in results] == [
+            180_000.00 * (i + 1) for i in range(10)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_at_max_batch_size(self):
+        """Test that a burst larger than max_batch_size is split."""
+        engine = RecordingEngine()
+        dispatcher = BatchedValuationDispatcher(engine, max_batch_size=4)
+        dispatcher.start()
+        try:
+            await asyncio.gather(*[dispatcher.submit(make_request()) for _ in range(10)])
+        finally:
+            await dispatcher.stop()
+
+        assert engine.batch_sizes == [4, 4, 2]
+
+    @pytest.mark.asyncio
+    async def test_error_only_reaches_its_caller(self):
+        """Test that an invalid item does not fail the rest of its batch."""
+        dispatcher = BatchedValuationDispatcher(ValuationEngine())
+        dispatcher.start()
+        try:
+            bad = make_request().model_copy(update={"size_sqft": 0})
+            good, failed = await asyncio.gather(
+                dispatcher.submit(make_request()),
+                dispatcher.submit(bad),
+                return_exceptions=True
+            )
+        finally:
+            await dispatcher.stop()
+
+        assert good.estimated_value == 1_620_000.00
+        assert isinstance(failed, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_stop_falls_back_to_direct_valuation(self):
+        """Test that the dispatcher keeps working after it is stopped."""
+        dispatcher = BatchedValuationDispatcher(ValuationEngine())
+        dispatcher.start()
+        assert dispatcher.running
+
+        await dispatcher.stop()
+        assert not dispatcher.running
+
+        result = await dispatcher.submit(make_request())
+        assert result.estimated_value == 1_620_000.00
+
+    @pytest.mark.asyncio
+    async def test_stop_values_queued_requests(self):
+        """Test that requests still queued at shutdown are valued, not failed."""
+        engine = RecordingEngine()
+        dispatcher = BatchedValuationDispatcher(engine)
+        dispatcher.start()
+
+        pending = [asyncio.create_task(dispatcher.submit(make_request())) for _ in range(3)]
+        await asyncio.sleep(0)  # let the submissions enqueue
+        await dispatcher.stop()
+
+        results = await asyncio.gather(*pending)
+        assert [r.estimated_value for r in results] == [1_620_000.00] * 3
+        assert sum(engine.batch_sizes) == 3
@@ -1,12 +1,32 @@
 """Tests for request and response models."""
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import get_args
 
+import orjson
 import pytest
 from pydantic import ValidationError
 
-from app.models.request import ValuationRequest, PropertyType
+from app.models.request import (
+    BatchValuationRequest,
+    MAX_BATCH_ITEMS,
+    PropertyType,
+    PropertyTypeName,
+    ValuationRequest,
+)
 from app.models.response import ValuationResponse, ValuationBreakdown
 
+_PROPERTY_TYPES = tuple(PropertyType)
+
+
+@pytest.fixture(scope="module", name="breakdown")
+def fixture_breakdown():
+    """Breakdown for a $4M valuation, shared by tests that just need a valid one."""
+    return ValuationBreakdown(
+        base_value=5000000.00,
+        depreciation_factor=0.20,
+        final_value=4000000.00
+    )
+
 
 class TestValuationRequest:
     """Test suite for ValuationRequest model."""
@@ -14,7 +34,7 @@ class TestValuationRequest:
     def test_valid_request(self):
         """Test creating a valid valuation request."""
         request = ValuationRequest(
-            property_type=PropertyType.MULTIFAMILY,
+            property_type=PropertyType.MULTIFAMILY.value,
             size_sqft=50000,
             age_years=15
         )
@@ -25,14 +45,28 @@ class TestValuationRequest:
 
     def test_all_property_types(self):
         """Test all valid property types."""
-        for prop_type in PropertyType:
+        for prop_type in _PROPERTY_TYPES:
             request = ValuationRequest(
-                property_type=prop_type,
+                property_type=prop_type.value,
                 size_sqft=10000,
                 age_years=10
             )
             assert request.property_type == prop_type
 
+    def test_property_type_name_matches_enum(self):
+        """Test that the accepted literals are exactly the PropertyType values."""
+        assert get_args(PropertyTypeName) == tuple(p.value for p in _PROPERTY_TYPES)
+
+    def test_property_type_is_plain_string(self):
+        """Test that a validated property_type is a bare str, not an enum."""
+        request = ValuationRequest(
+            property_type="OFFICE",
+            size_sqft=10000,
+            age_years=10
+        )
+
+        assert type(request.property_type) is str  # pylint: disable=unidiomatic-typecheck
+
     def test_invalid_property_type(self):
         """Test invalid property type raises error."""
         with pytest.raises(ValidationError):
@@ -46,7 +80,7 @@ class TestValuationRequest:
         """Test that zero size_sqft raises error."""
         with pytest.raises(ValidationError):
             ValuationRequest(
-                property_type=PropertyType.OFFICE,
+                property_type=PropertyType.OFFICE.value,
                 size_sqft=0,
                 age_years=10
             )
@@ -55,16 +89,25 @@ class TestValuationRequest:
         """Test that negative size_sqft raises error."""
         with pytest.raises(ValidationError):
             ValuationRequest(
-                property_type=PropertyType.OFFICE,
+                property_type=PropertyType.OFFICE.value,
                 size_sqft=-1000,
                 age_years=10
             )
 
+    def test_non_numeric_size_sqft(self):
+        """Test that a non-numeric size_sqft raises error."""
+        with pytest.raises(ValidationError):
+            ValuationRequest(
+                property_type=PropertyType.OFFICE.value,
+                size_sqft="ten thousand",
+                age_years=10
+            )
+
     def test_negative_age_years(self):
         """Test that negative age_years raises error."""
         with pytest.raises(ValidationError):
             ValuationRequest(
-                property_type=PropertyType.RETAIL,
+                property_type=PropertyType.RETAIL.value,
                 size_sqft=10000,
                 age_years=-5
             )
@@ -73,7 +116,7 @@ class TestValuationRequest:
         """Test that excessive size_sqft raises error."""
         with pytest.raises(ValidationError):
             ValuationRequest(
-                property_type=PropertyType.INDUSTRIAL,
+                property_type=PropertyType.INDUSTRIAL.value,
                 size_sqft=15_000_000,  # Exceeds max
                 age_years=10
             )
@@ -82,16 +125,48 @@ class TestValuationRequest:
         """Test that excessive age_years raises error."""
         with pytest.raises(ValidationError):
             ValuationRequest(
-                property_type=PropertyType.OFFICE,
+                property_type=PropertyType.OFFICE.value,
                 size_sqft=10000,
                 age_years=250  # Exceeds limit
             )
 
+    def test_size_and_age_limits_inclusive(self):
+        """Test that the maximum size and age are themselves accepted."""
+        request = ValuationRequest(
+            property_type="INDUSTRIAL",
+            size_sqft=10_000_000,
+            age_years=200
+        )
+
+        assert request.size_sqft == 10_000_000
+        assert request.age_years == 200
+
+    def test_unknown_field_rejected(self):
+        """Test that unexpected fields raise error."""
+        with pytest.raises(ValidationError):
+            ValuationRequest(
+                property_type="OFFICE",
+                size_sqft=10000,
+                age_years=10,
+                zip_code="10001"
+            )
+
+    def test_request_is_immutable(self):
+        """Test that a validated request cannot be modified."""
+        request = ValuationRequest(
+            property_type="OFFICE",
+            size_sqft=10000,
+            age_years=10
+        )
+
+        with pytest.raises(ValidationError):
+            request.size_sqft = 20000
+
     def test_missing_required_field(self):
         """Test that missing required field raises error."""
         with pytest.raises(ValidationError):
             ValuationRequest(
-                property_type=PropertyType.OFFICE,
+                property_type=PropertyType.OFFICE.value,
                 size_sqft=10000
                 # Missing age_years
             )
@@ -99,15 +174,17 @@ class TestValuationRequest:
     def test_json_serialization(self):
         """Test that request can be serialized to JSON."""
         request = ValuationRequest(
-            property_type=PropertyType.RETAIL,
+            property_type=PropertyType.RETAIL.value,
             size_sqft=5000,
             age_years=8
         )
 
-        json_data = request.model_dump()
+        raw = request.model_dump_json()
+        json_data = orjson.loads(raw)
         assert json_data["property_type"] == "RETAIL"
         assert json_data["size_sqft"] == 5000
         assert json_data["age_years"] == 8
+        assert ValuationRequest.model_validate_json(raw) == request
 
     def test_string_property_type(self):
         """Test that string property type is accepted."""
@@ -120,6 +197,48 @@ class TestValuationRequest:
         assert request.property_type == PropertyType.MULTIFAMILY
 
 
+class TestBatchValuationRequest:
+    """Test suite for BatchValuationRequest model."""
+
+    def test_valid_batch(self):
+        """Test creating a valid batch request from plain dicts."""
+        batch = BatchValuationRequest(items=[
+            {"property_type": "RETAIL", "size_sqft": 5000, "age_years": 8},
+            {"property_type": "OFFICE", "size_sqft": 20000, "age_years": 3}
+        ])
+
+        items = list(batch.items)
+        assert len(items) == 2
+        assert isinstance(items[0], ValuationRequest)
+        assert items[1].property_type == PropertyType.OFFICE
+
+    def test_empty_batch(self):
+        """Test that an empty batch raises error."""
+        with pytest.raises(ValidationError):
+            BatchValuationRequest(items=[])
+
+    def test_batch_size_limit(self):
+        """Test that batches above MAX_BATCH_ITEMS raise error."""
+        item = {"property_type": "OFFICE", "size_sqft": 10000, "age_years": 10}
+
+        BatchValuationRequest(items=[item] * MAX_BATCH_ITEMS)
+        with pytest.raises(ValidationError):
+            BatchValuationRequest(items=[item] * (MAX_BATCH_ITEMS + 1))
+
+    def test_invalid_item(self):
+        """Test that an invalid item invalidates the batch."""
+        with pytest.raises(ValidationError):
+            BatchValuationRequest(items=[
+                {"property_type": "OFFICE", "size_sqft": 10000, "age_years": -1}
+            ])
+
+    def test_unknown_field_rejected(self):
+        """Test that unexpected envelope fields raise error."""
+        item = {"property_type": "OFFICE", "size_sqft": 10000, "age_years": 10}
+        with pytest.raises(ValidationError):
+            BatchValuationRequest(items=[item], callback_url="https://example.com")
+
+
 class TestValuationBreakdown:
     """Test suite for ValuationBreakdown model."""
 
@@ -177,51 +296,35 @@ class TestValuationBreakdown:
 class TestValuationResponse:
     """Test suite for ValuationResponse model."""
 
-    def test_valid_response(self):
+    def test_valid_response(self, breakdown):
         """Test creating a valid valuation response."""
-        breakdown = ValuationBreakdown(
-            base_value=2000000.00,
-            depreciation_factor=0.10,
-            final_value=1800000.00
-        )
-
         response = ValuationResponse(
-            estimated_value=1800000.00,
-            valuation_date=datetime.utcnow(),
+            estimated_value=4000000.00,
+            valuation_date=datetime.now(timezone.utc),
             methodology="Base rate with depreciation",
             breakdown=breakdown
         )
 
-        assert response.estimated_value == 1800000.00
+        assert response.estimated_value == 4000000.00
         assert isinstance(response.valuation_date, datetime)
         assert response.methodology == "Base rate with depreciation"
         assert response.breakdown == breakdown
 
-    def test_default_valuation_date(self):
+    def test_default_valuation_date(self, breakdown):
         """Test that valuation_date has default value."""
-        breakdown = ValuationBreakdown(
-            base_value=1000000.00,
-            depreciation_factor=0.05,
-            final_value=950000.00
-        )
-
         response = ValuationResponse(
-            estimated_value=950000.00,
+            estimated_value=4000000.00,
             methodology="Test methodology",
             breakdown=breakdown
         )
 
         assert response.valuation_date is not None
         assert isinstance(response.valuation_date, datetime)
+        # pylint infers the Field() default; valuation_date is a datetime here
+        assert response.valuation_date.utcoffset() == timedelta(0)  # pylint: disable=no-member
 
-    def test_invalid_zero_estimated_value(self):
+    def test_invalid_zero_estimated_value(self, breakdown):
         """Test that zero estimated_value raises error."""
-        breakdown = ValuationBreakdown(
-            base_value=0.00,
-            depreciation_factor=0.0,
-            final_value=0.00
-        )
-
         with pytest.raises(ValidationError):
             ValuationResponse(
                 estimated_value=0.00,
@@ -229,14 +332,8 @@ class TestValuationResponse:
                 breakdown=breakdown
             )
 
-    def test_invalid_negative_estimated_value(self):
+    def test_invalid_negative_estimated_value(self, breakdown):
         """Test that negative estimated_value raises error."""
-        breakdown = ValuationBreakdown(
-            base_value=1000000.00,
-            depreciation_factor=0.5,
-            final_value=500000.00
-        )
-
         with pytest.raises(ValidationError):
             ValuationResponse(
                 estimated_value=-100000.00,
@@ -258,9 +355,11 @@ class TestValuationResponse:
             breakdown=breakdown
         )
 
-        json_data = response.model_dump()
+        raw = response.model_dump_json()
+        json_data = orjson.loads(raw)
         assert json_data["estimated_value"] == 4000000.00
         assert "valuation_date" in json_data
         assert json_data["methodology"] == "Test methodology"
         assert "breakdown" in json_data
         assert json_data["breakdown"]["base_value"] == 5000000.00
+        assert ValuationResponse.model_validate_json(raw) == response